@@ -52,18 +52,22 @@ EXPLICIT_BOILERPLATE_STRINGS = {
     "Bit descriptions"
 }
 
-TYPE_TOKENS = {
+TYPE_TOKENS = frozenset({
     "RO","RW","WO","R/W","R/W1C","R/W1S","R/W1P","R/WC","R/W0C","R/W0S","R/W0P",
     "R/W0","R/W1","R/WS","R/WP","R/C","R/S","R0","W1C","W1S","W1P","RWL"
-}
+})
 
-# Performance optimization: Pre-sort TYPE_TOKENS for efficient longest-first matching
+# Longest first, so e.g. R/W1C is tried before R/W by the matchers built from this list
 SORTED_TYPE_TOKENS = sorted(TYPE_TOKENS, key=len, reverse=True)
+# Whole-word matcher per type token (longest first), for find_type_token_position
+TYPE_TOKEN_WORD_PATTERNS = [(token, re.compile(r'\b' + re.escape(token) + r'\b')) for token in SORTED_TYPE_TOKENS]
+# "... description TYPE RESET" at the end of a field description
+EMBEDDED_TYPE_RESET_PATTERN = re.compile(r'\s+(' + '|'.join(SORTED_TYPE_TOKENS) + r')\s+(0b[01]+|0x[0-9A-Fa-f]+|-)\s*$')
 
 # Constants for maintainability
 MIN_NAME_LENGTH = 3  # Minimum valid register name length
 LONG_NAME_THRESHOLD = 10  # Threshold for relaxed validation
-HEADER_LABELS = {'offset','name','type','description','reset','bits'}
+HEADER_LABELS = frozenset({'offset','name','type','description','reset','bits'})
 
 # Reserved concatenation artifact detection constants
 RESERVED_PREFIX = "Reserved"
@@ -71,11 +75,68 @@ RESERVED_PREFIX_LENGTH = len(RESERVED_PREFIX)
 # Pre-compiled for ~10% performance improvement over inline regex
 RESERVED_CONCATENATION_PATTERN = re.compile(r'^\d+.*[a-zA-Z]')
 
-ADDR_SEPARATORS = {":", "-", "–", ",", ";"}
+ADDR_SEPARATORS = frozenset({":", "-", "–", ",", ";"})
 # One or more address tokens only (no names/types)
 addr_token_re = r'(?:\{\s*\d+(?:\s*-\s*\d+)?\s*\}|0x[0-9A-Fa-f]+|:|,|–|-)'
 addr_line_re  = re.compile(r'^(?:\s*' + addr_token_re + r'\s*)+$')
 
+# Register summary table rows, tried in this order by parse_register_tables
+# {0-15} 0xD80 : 0xDF8; {16-47} 0x2880 : 0x2978    name    RW    description
+multi_segment_row_re = re.compile(r'^(\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+(?:\s*;\s*\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+)+)\s+(\S+)\s+(\S+)?\s*(.*)?')
+# {0-31} 0x3000 : 0x31F8    name    RW    description
+array_row_re = re.compile(r'^(\{\d+-\d+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+)\s+(\S+)\s+(\S+)?\s*(.*)?')
+# 0x100 : 0x200    name    RW    description
+range_row_re = re.compile(r'^(0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+)\s+(\S+)\s+(\S+)?\s*(.*)?')
+# 0x100 + 0x80    name    RW    description
+offset_plus_row_re = re.compile(r'^(0x[0-9A-Fa-f]+\s*\+\s*0x[0-9A-Fa-f]+)\s+(\S+)\s+(\S+)?\s*(.*)?')
+# 0x100    name    RW    description
+simple_row_re = re.compile(r'^(0x[0-9A-Fa-f]+)\s+(\S+)\s+(\S+)?\s*(.*)?')
+# 0x100 name (type/description on the following lines)
+offset_name_row_re = re.compile(r'^(0x[0-9A-Fa-f]+)\s+([A-Za-z_][A-Za-z0-9_]*(?:[+-][A-Za-z0-9_]+)*)$')
+register_header_re = re.compile(r'^Oﬀset\s+Name\s+')  # column header (with ligature)
+register_section_end_re = re.compile(r'^\s*8\.3\.')  # detailed register description section
+
+# Line-joining patterns used by clean_pdf_text (and page detection in get_lines_from_text)
+table_title_re = re.compile(r'^(Table \d+-\d+:.*)')
+attribute_header_re = re.compile(r'^Bits\s+Name\s+')
+# "0x2240 :" (range end on the next line)
+open_range_re = re.compile(r'^0x[0-9A-Fa-f]+\s*:$')
+# "0x11A0 : 0x11B8" on its own line
+range_only_re = re.compile(r'^0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+\s*$')
+offset_name_re = re.compile(r'^0x[0-9A-Fa-f]+\s+\w+')
+offset_rest_re = re.compile(r'^(0x[0-9A-Fa-f]+)\s+(.*)')
+# "0x2080 name_prefix_    RW ..." (name wraps after an underscore)
+wrapped_reg_name_re = re.compile(r'^0x[0-9A-Fa-f]+.*_\s+(RW|RO|WO|RWL|W1C|W1S|R/W)')
+# indented lowercase name continuation
+name_tail_re = re.compile(r'^\s+[a-z_]+\s*$')
+# "[31:29] htg#{index*4 +    ..." (field name wraps after "+")
+wrapped_field_re = re.compile(r'^\[[\d:]+\]\s+.*\+\s+')
+wrapped_field_parts_re = re.compile(r'^(\[[\d:]+\])\s+(\S+\s*\+)\s+(.*)')
+wrapped_field_tail_re = re.compile(r'^\s+.*\}_')
+indented_token_re = re.compile(r'^\s+(\S+)')
+# "{4-19}" on its own line
+array_index_only_re = re.compile(r'^\{[\d-]+\}$')
+# "{0-3}  name ..." with the offset on later lines
+array_name_re = re.compile(r'^\{[\d-]+\}\s+\w+')
+array_offset_start_re = re.compile(r'^\{[\d-]+\}\s+0x')
+array_rest_re = re.compile(r'^(\{[\d-]+\})\s+(.*)')
+# "{0-1}  partial_name_    RW ..." followed by "0x37E0 name_tail", ":", "0x37E8"
+array_name_type_re = re.compile(r'^\{[\d-]+\}\s+\w+.*?\s+(RW|RO|WO|RWL|W1C|W1S|R/W)')
+array_name_type_parts_re = re.compile(r'^(\{[\d-]+\})\s+(.*?)\s+(RW|RO|WO|RWL|W1C|W1S|R/W)\s+(.*)')
+# "{0-31} 0x3000 :    name ..." (range end on the next line)
+array_open_range_re = re.compile(r'^\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:')
+array_open_range_parts_re = re.compile(r'^(\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:)\s*(.*)')
+# "{0-4} 0xF80 : 0xFA0    name ..." possibly followed by "{5-31} 0x6028 : 0x60F8"
+array_range_name_re = re.compile(r'^\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+\s+\w+')
+array_range_rest_re = re.compile(r'^(\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+)\s+(.*)')
+array_range_only_re = re.compile(r'^\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+$')
+# page footer line in raw pdftotext output
+page_line_re = re.compile(r'^\s*Page\s+\d+')
+
+# Attribute table rows: "[15:0]    field_name    Description text    RW    0x00"
+attr_template_row_re = re.compile(r'^(\[\d+(?::\d+)?\])\s+([a-zA-Z_][a-zA-Z0-9_]*(?:#{[^}]+}[a-zA-Z0-9_]*)?)\s+(.*?)$')  # htg#{index*8 + 7}_num_hn
+attr_simple_row_re = re.compile(r'^(\[\d+(?::\d+)?\])\s+(\S+)(?:\s+(.*?))?$')
+
 # Things that must never be treated as a register name
 BAD_NAME_PREFIXES = {
     "reset value", "reset values",
@@ -85,12 +146,24 @@ BAD_NAME_PREFIXES = {
     "usage constraints", "usage constraint",
     "non-confidential"
 }
+# str.startswith() takes a tuple - checks every prefix in one C call
+BAD_NAME_PREFIX_TUPLE = tuple(BAD_NAME_PREFIXES)
 # Reset-noise anywhere in a line (more robust than prefix-only)
 RESET_NOISE_RE = re.compile(
     r'\b(reset\s+value|reset\s+values|see\s+individual\s+bit\s+resets?)\b',
     re.IGNORECASE
 )
 
+# Small patterns used by the per-line helpers (compiled once instead of per call)
+whitespace_re     = re.compile(r'\s+')
+colon_sep_re      = re.compile(r'\s*:\s*')
+comma_sep_re      = re.compile(r'\s*,\s*')
+multi_sentence_re = re.compile(r'\. [A-Z]')       # "... text. Next sentence"
+sub_bit_item_re   = re.compile(r'^\d+-$')          # "1-", "2-" from sub-bit descriptions
+digits_hyphen_re  = re.compile(r'^[\d\-]+$')
+has_letter_re     = re.compile(r'[A-Za-z_]')
+name_fragment_re  = re.compile(r'[A-Za-z0-9_]+')
+
 # ------------------ Helpers ------------------
 def is_reserved_concatenation_artifact(name: str) -> bool:
     """
@@ -130,7 +203,7 @@ def clean_line(s: str) -> str:
     # Preserve leading spaces (important for continuation lines) but normalize internal spaces
     # Strip only trailing whitespace
     leading_spaces = len(s) - len(s.lstrip())
-    s_cleaned = re.sub(r'\s+', ' ', s.strip())
+    s_cleaned = whitespace_re.sub(' ', s.strip())
     # Re-add leading spaces if there were any
     if leading_spaces > 0 and s_cleaned:
         return ' ' * leading_spaces + s_cleaned
@@ -199,12 +272,12 @@ def clean_pdf_text(input_path: str, output_path: str):
         
         # Check for Table header to track current table
         if line.startswith('Table ') and ':' in line:
-            table_match = re.match(r'^(Table \d+-\d+:.*)', line)
+            table_match = table_title_re.match(line)
             if table_match:
                 current_table = table_match.group(1)
         
         # Check for repeated column headers and skip if duplicate
-        if re.match(r'^Oﬀset\s+Name\s+', line) or re.match(r'^Bits\s+Name\s+', line):
+        if register_header_re.match(line) or attribute_header_re.match(line):
             # Create a key for this table's header
             header_key = f"{current_table}:{line.strip()}"
             if header_key in seen_table_headers:
@@ -226,8 +299,8 @@ def clean_pdf_text(input_path: str, output_path: str):
         
         # Handle offset range splits (two patterns)
         # Pattern 1: "0x2240 :" followed by "0x2248" (colon on first line)
-        if re.match(r'^0x[0-9A-Fa-f]+\s*:$', line.strip()):
-            if i + 1 < len(cleaned_lines) and re.match(r'^0x[0-9A-Fa-f]+$', cleaned_lines[i + 1].strip()):
+        if open_range_re.match(line.strip()):
+            if i + 1 < len(cleaned_lines) and offset_re.match(cleaned_lines[i + 1].strip()):
                 # Join the two lines into an offset range
                 combined = f"{line.strip()} {cleaned_lines[i + 1].strip()}\n"
                 pass2_lines.append(combined)
@@ -235,9 +308,9 @@ def clean_pdf_text(input_path: str, output_path: str):
                 continue
         
         # Pattern 2: "0x2240" followed by ":" followed by "0x2248" (colon on separate line)
-        if re.match(r'^0x[0-9A-Fa-f]+$', line.strip()):
+        if offset_re.match(line.strip()):
             if i + 1 < len(cleaned_lines) and cleaned_lines[i + 1].strip() == ':':
-                if i + 2 < len(cleaned_lines) and re.match(r'^0x[0-9A-Fa-f]+$', cleaned_lines[i + 2].strip()):
+                if i + 2 < len(cleaned_lines) and offset_re.match(cleaned_lines[i + 2].strip()):
                     # Join the three lines into an offset range
                     combined = f"{line.strip()} : {cleaned_lines[i + 2].strip()}\n"
                     pass2_lines.append(combined)
@@ -257,20 +330,20 @@ def clean_pdf_text(input_path: str, output_path: str):
         # Handle wrapped attribute field names
         # Pattern: "[31:29] htg#{index*4 +                         configuration to map..."
         # Next line: "        1}_hnf_cal_override_map_11"
-        if re.match(r'^\[[\d:]+\]\s+.*\+\s+', line) and i + 1 < len(pass2_lines):
+        if wrapped_field_re.match(line) and i + 1 < len(pass2_lines):
             next_line = pass2_lines[i + 1]
             # Check if next line is the field name continuation
-            if re.match(r'^\s+.*\}_', next_line):
+            if wrapped_field_tail_re.match(next_line):
                 # Extract components from first line
                 # Pattern: [bits] incomplete_field_name+ description type reset
-                bits_match = re.match(r'^(\[[\d:]+\])\s+(\S+\s*\+)\s+(.*)', line)
+                bits_match = wrapped_field_parts_re.match(line)
                 if bits_match:
                     bits = bits_match.group(1)
                     incomplete_name = bits_match.group(2).rstrip()  # Remove trailing spaces after +
                     remaining = bits_match.group(3)
                     
                     # Extract field name continuation from next line
-                    continuation_match = re.match(r'^\s+(\S+)', next_line)
+                    continuation_match = indented_token_re.match(next_line)
                     if continuation_match:
                         name_continuation = continuation_match.group(1)
                         
@@ -292,7 +365,7 @@ def clean_pdf_text(input_path: str, output_path: str):
         # Next line: "0x37E0 cfg_reg0-1"
         # Next line: ":"
         # Next line: "0x37E8"
-        if (re.match(r'^\{[\d-]+\}\s+\w+.*?\s+(RW|RO|WO|RWL|W1C|W1S|R/W)', line) and 
+        if (array_name_type_re.match(line) and 
             i + 3 < len(pass2_lines)):
             
             # Check if this matches the pattern where offset comes after
@@ -301,13 +374,13 @@ def clean_pdf_text(input_path: str, output_path: str):
             line3 = pass2_lines[i + 3].strip()
             
             # Look for: "0x37E0 cfg_reg0-1", ":", "0x37E8"
-            if (re.match(r'^0x[0-9A-Fa-f]+\s+\w+', line1) and 
+            if (offset_name_re.match(line1) and 
                 line2 == ':' and 
-                re.match(r'^0x[0-9A-Fa-f]+$', line3)):
+                offset_re.match(line3)):
                 
                 # Extract components
-                array_match = re.match(r'^(\{[\d-]+\})\s+(.*?)\s+(RW|RO|WO|RWL|W1C|W1S|R/W)\s+(.*)', line)
-                offset_match = re.match(r'^(0x[0-9A-Fa-f]+)\s+(.*)', line1)
+                array_match = array_name_type_parts_re.match(line)
+                offset_match = offset_rest_re.match(line1)
                 
                 if array_match and offset_match:
                     array_indices = array_match.group(1)
@@ -331,12 +404,12 @@ def clean_pdf_text(input_path: str, output_path: str):
         # Handle wrapped register names (name ends with _ and has continuation)
         # Pattern: "0x2080 por_c2capb_c2c_port_ingressid_route_table_                RW     por_c2capb_c2c_port_ingressid_route_table_control_and_status"
         # Next line: "       control_and_status"
-        if re.match(r'^0x[0-9A-Fa-f]+.*_\s+(RW|RO|WO|RWL|W1C|W1S|R/W)', line):
+        if wrapped_reg_name_re.match(line):
             # This register name ends with underscore before the type
             if i + 1 < len(cleaned_lines):
                 next_line = cleaned_lines[i + 1]
                 # Check if next line is the continuation (indented lowercase text)
-                if re.match(r'^\s+[a-z_]+\s*$', next_line.rstrip('\n')):
+                if name_tail_re.match(next_line.rstrip('\n')):
                     # Skip the continuation line - we already have the full name in description
                     i += 2  # Skip both current and continuation
                     final_lines.append(line)
@@ -345,14 +418,14 @@ def clean_pdf_text(input_path: str, output_path: str):
         # Handle array offset splits where ending offset is on next line
         # Pattern: "{0-31} 0x3000 :    ra_rnsam_hashed_tgt_grp_cfg1_region0-31 ..."
         # Next line: "0x30F8"
-        if re.match(r'^\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:', line):
+        if array_open_range_re.match(line):
             if i + 1 < len(cleaned_lines):
                 next_line = cleaned_lines[i + 1].strip()
                 # Check if next line is just a hex offset
-                if re.match(r'^0x[0-9A-Fa-f]+$', next_line):
+                if offset_re.match(next_line):
                     # Join the lines properly
                     # Extract parts from the first line
-                    match = re.match(r'^(\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:)\s*(.*)', line)
+                    match = array_open_range_parts_re.match(line)
                     if match:
                         offset_part = match.group(1)
                         rest_of_line = match.group(2)
@@ -367,14 +440,14 @@ def clean_pdf_text(input_path: str, output_path: str):
         # Next line: "0x11A0 : 0x11B8"
         # Possibly more: "{4-19}"
         # And: "0x2A20 : 0x2A98"
-        if re.match(r'^\{[\d-]+\}\s+\w+', line) and not re.match(r'^\{[\d-]+\}\s+0x', line):
+        if array_name_re.match(line) and not array_offset_start_re.match(line):
             # This line starts with array index but no offset - check if offset is on next line
             if i + 1 < len(pass2_lines):
                 next_line = pass2_lines[i + 1].strip()
-                if re.match(r'^0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+\s*$', next_line):
+                if range_only_re.match(next_line):
                     # Found offset on next line - merge them
                     # Extract the array index from current line
-                    match = re.match(r'^(\{[\d-]+\})\s+(.*)', line)
+                    match = array_rest_re.match(line)
                     if match:
                         array_idx = match.group(1)
                         rest_of_line = match.group(2).rstrip('\n')
@@ -391,7 +464,7 @@ def clean_pdf_text(input_path: str, output_path: str):
                                 continue
                             
                             # Check for another array+offset pair
-                            if re.match(r'^\{[\d-]+\}$', lookahead):
+                            if array_index_only_re.match(lookahead):
                                 # Found another array index - look for its offset in wider range
                                 continuation_array_idx = lookahead
                                 offset_found = False
@@ -401,16 +474,16 @@ def clean_pdf_text(input_path: str, output_path: str):
                                     if not offset_candidate:  # Skip blank lines
                                         k += 1
                                         continue
-                                    if re.match(r'^0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+\s*$', offset_candidate):
+                                    if range_only_re.match(offset_candidate):
                                         # Add to offset part, not end of line
                                         offset_part += f"; {continuation_array_idx} {offset_candidate}"
                                         j = k + 1
                                         offset_found = True
                                         break
-                                    elif re.match(r'^0x[0-9A-Fa-f]+$', offset_candidate):
+                                    elif offset_re.match(offset_candidate):
                                         # Handle split offset (start only, look for end)
                                         if k + 2 < len(pass2_lines):
-                                            if pass2_lines[k + 1].strip() == ':' and re.match(r'^0x[0-9A-Fa-f]+$', pass2_lines[k + 2].strip()):
+                                            if pass2_lines[k + 1].strip() == ':' and offset_re.match(pass2_lines[k + 2].strip()):
                                                 full_offset = f"{offset_candidate} : {pass2_lines[k + 2].strip()}"
                                                 # Add to offset part, not end of line
                                                 offset_part += f"; {continuation_array_idx} {full_offset}"
@@ -442,9 +515,9 @@ def clean_pdf_text(input_path: str, output_path: str):
         # Pattern: "{0-4} 0xF80 : 0xFA0       cmn_hns_cml_port_aggr_grp0-4_add_mask ..."
         # Next line(s): blank
         # Next line: "{5-31} 0x6028 : 0x60F8"
-        if re.match(r'^\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+\s+\w+', line):
+        if array_range_name_re.match(line):
             # Extract components from current line  
-            match = re.match(r'^(\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+)\s+(.*)', line)
+            match = array_range_rest_re.match(line)
             if match:
                 offset_part = match.group(1)
                 rest_of_line = match.group(2).rstrip('\n')
@@ -455,7 +528,7 @@ def clean_pdf_text(input_path: str, output_path: str):
                 while j < len(pass2_lines) and j <= i + 3:
                     lookahead = pass2_lines[j].strip()
                     # Check if this is a continuation offset (just the offset, no register name)
-                    if re.match(r'^\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+$', lookahead):
+                    if array_range_only_re.match(lookahead):
                         # Add to offset part, not end of line
                         offset_part += f"; {lookahead}"
                         i = j + 1
@@ -531,7 +604,7 @@ def get_lines_from_text(text_path: str):
             page_num = 0
             for raw in f:
                 # Detect page breaks (form feed character or specific patterns)
-                if '\f' in raw or 'Page ' in raw and re.match(r'^\s*Page\s+\d+', raw):
+                if '\f' in raw or 'Page ' in raw and page_line_re.match(raw):
                     lines.append(f"__PAGE_BREAK_{page_num}__")
                     page_num += 1
                     continue
@@ -560,7 +633,7 @@ def is_probable_name(s: str) -> bool:
     
     low = s.lower()
     if low in HEADER_LABELS: return False
-    if any(low.startswith(p) for p in BAD_NAME_PREFIXES): return False
+    if low.startswith(BAD_NAME_PREFIX_TUPLE): return False
     if RESET_NOISE_RE.search(s): return False
     if is_addr_line(s) or is_addr_token(s) or is_heading(s) or is_section_heading(s) or is_type_token(s):
         return False
@@ -588,7 +661,7 @@ def is_probable_name(s: str) -> bool:
         return False
     
     # ENHANCED: Reject strings that contain multiple sentences (period + space + capital letter)
-    if re.search(r'\. [A-Z]', s):
+    if multi_sentence_re.search(s):
         return False
     
     # Hot fix: Handle "ReservedReserved" case - likely a PDF extraction artifact
@@ -602,31 +675,31 @@ def is_probable_name(s: str) -> bool:
     
     # CRITICAL FIX: Reject patterns like "1-", "2-" etc which are from sub-bit descriptions
     # These appear when PDF extraction includes sub-bit definitions within field descriptions
-    if re.match(r'^\d+-$', s):
+    if sub_bit_item_re.match(s):
         return False
     
     # ENHANCED: Reject standalone hyphen or hyphen with just numbers
-    if s == '-' or re.match(r'^[\d\-]+$', s):
+    if s == '-' or digits_hyphen_re.match(s):
         return False
     
     # require letters/underscore somewhere; avoids misreading offsets/ranges as names
-    return bool(re.search(r'[A-Za-z_]', s))
+    return bool(has_letter_re.search(s))
 
 def is_name_continuation(s: str) -> bool:
     # Names sometimes wrap after an underscore. Accept purely [A-Za-z0-9_]+ fragments as continuation.
     if not s or s.startswith("__PAGE_BREAK_"): return False
     if is_type_token(s) or is_heading(s) or is_section_heading(s): return False
     low = s.lower()
-    if low in HEADER_LABELS or any(low.startswith(p) for p in BAD_NAME_PREFIXES): return False
+    if low in HEADER_LABELS or low.startswith(BAD_NAME_PREFIX_TUPLE): return False
     if RESET_NOISE_RE.search(s): return False
-    return bool(re.fullmatch(r'[A-Za-z0-9_]+', s))
+    return bool(name_fragment_re.fullmatch(s))
 
 def normalize_addr(expr: str) -> str:
-    expr = re.sub(r'\s+', ' ', expr.strip())
+    expr = whitespace_re.sub(' ', expr.strip())
     # normalize spaces around punctuation
-    expr = re.sub(r'\s*:\s*', ' : ', expr)
-    expr = re.sub(r'\s*,\s*', ', ', expr)
-    expr = re.sub(r'\s+', ' ', expr)
+    expr = colon_sep_re.sub(' : ', expr)
+    expr = comma_sep_re.sub(', ', expr)
+    expr = whitespace_re.sub(' ', expr)
     # Keep "A + B" format as-is for offset+size notation (don't convert to range)
     # expr = re.sub(r'(0x[0-9A-Fa-f]+)\s*\+\s*(0x[0-9A-Fa-f]+)', r'\1 : \2', expr)
     return expr
@@ -669,19 +742,23 @@ def parse_register_tables(lines):
             continue
 
         # Skip page breaks / column headers with ligatures
-        if s.startswith("__PAGE_BREAK_") or s.lower() in HEADER_LABELS or re.match(r'^Oﬀset\s+Name\s+', s):
+        if s.startswith("__PAGE_BREAK_") or s.lower() in HEADER_LABELS or register_header_re.match(s):
             i += 1
             continue
         
         # Check for section header (e.g., "8.3.1.1 por_apb_node_info") which marks end of table
-        if re.match(r'^\s*8\.3\.', s):
+        if register_section_end_re.match(s):
             # This is a detailed register description section, not part of the summary table
             in_register_mode = False
             continue
         
         # NEW: Handle pdftotext format with space-separated columns
         # Pattern 1: Multi-segment array format "{0-15} 0xD80 : 0xDF8; {16-47} 0x2880 : 0x2978 register_name RW description"
-        multi_segment_match = re.match(r'^(\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+(?:\s*;\s*\{[\d-]+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+)+)\s+(\S+)\s+(\S+)?\s*(.*)?', s)
+        # Every row pattern starts with '{' (array offsets) or '0x' - only try the ones that can match
+        brace_line = s.startswith('{')
+        hex_line = s.startswith('0x')
+        # (a multi-segment offset always contains ';' - single array lines skip its backtracking)
+        multi_segment_match = multi_segment_row_re.match(s) if brace_line and ';' in s else None
         if multi_segment_match:
             offset = multi_segment_match.group(1).strip()
             name = multi_segment_match.group(2).strip()
@@ -704,7 +781,7 @@ def parse_register_tables(lines):
             continue
             
         # Pattern 2: Single array format "{0-31} 0x3000 : 0x31F8    register_name    RW    description"
-        array_match = re.match(r'^(\{\d+-\d+\}\s+0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+)\s+(\S+)\s+(\S+)?\s*(.*)?', s)
+        array_match = array_row_re.match(s) if brace_line else None
         if array_match:
             offset = array_match.group(1).strip()
             name = array_match.group(2).strip()
@@ -727,7 +804,7 @@ def parse_register_tables(lines):
             continue
         
         # Pattern 3: Range format "0x100 : 0x200    register_name    RW    description"
-        range_match = re.match(r'^(0x[0-9A-Fa-f]+\s*:\s*0x[0-9A-Fa-f]+)\s+(\S+)\s+(\S+)?\s*(.*)?', s)
+        range_match = range_row_re.match(s) if hex_line else None
         if range_match:
             offset = range_match.group(1).strip()
             name = range_match.group(2).strip()
@@ -750,7 +827,7 @@ def parse_register_tables(lines):
             continue
         
         # Pattern 4: Offset+Size format "0x100 + 0x80    register_name    RW    description"
-        offset_plus_match = re.match(r'^(0x[0-9A-Fa-f]+\s*\+\s*0x[0-9A-Fa-f]+)\s+(\S+)\s+(\S+)?\s*(.*)?', s)
+        offset_plus_match = offset_plus_row_re.match(s) if hex_line else None
         if offset_plus_match:
             offset = offset_plus_match.group(1).strip()
             name = offset_plus_match.group(2).strip()
@@ -775,7 +852,7 @@ def parse_register_tables(lines):
             continue
         
         # Pattern 5: Simple format "0x100    register_name    RW    description"
-        simple_match = re.match(r'^(0x[0-9A-Fa-f]+)\s+(\S+)\s+(\S+)?\s*(.*)?', s)
+        simple_match = simple_row_re.match(s) if hex_line else None
         if simple_match:
             offset = simple_match.group(1).strip()
             name = simple_match.group(2).strip()
@@ -801,7 +878,7 @@ def parse_register_tables(lines):
 
         # ENHANCED: Check if this line has both offset and name concatenated
         # Pattern: "0xXXXX register_name"
-        offset_name_match = re.match(r'^(0x[0-9A-Fa-f]+)\s+([A-Za-z_][A-Za-z0-9_]*(?:[+-][A-Za-z0-9_]+)*)$', s)
+        offset_name_match = offset_name_row_re.match(s) if hex_line else None
         if offset_name_match:
             # Found offset and name on same line
             pending_addr = offset_name_match.group(1)
@@ -825,7 +902,7 @@ def parse_register_tables(lines):
                     break
                 if is_addr_line(t) or is_offset_token(t) or is_range_token(t) or is_addr_token(t):
                     break
-                if t.lower().startswith(tuple(BAD_NAME_PREFIXES)) or RESET_NOISE_RE.search(t):
+                if t.lower().startswith(BAD_NAME_PREFIX_TUPLE) or RESET_NOISE_RE.search(t):
                     break
                 if boilerplate_sentence_re.match(t):
                     i += 1
@@ -880,7 +957,7 @@ def parse_register_tables(lines):
             name_stripped = name.strip('"').strip()  # Remove quotes and whitespace
             if (boilerplate_sentence_re.match(name) or 
                 len(name) > 120 or 
-                re.search(r'\. [A-Z]', name) or
+                multi_sentence_re.search(name) or
                 name_stripped in EXPLICIT_BOILERPLATE_STRINGS or
                 name_stripped.startswith("This register is owned in the Non-secure space")):
                 # This joined name is actually boilerplate - skip this row entirely
@@ -905,7 +982,7 @@ def parse_register_tables(lines):
                     i = j  # Set main pointer to current position
                     break
                 # Avoid eating obvious reset/attribute headers into description
-                if t.lower().startswith(tuple(BAD_NAME_PREFIXES)) or RESET_NOISE_RE.search(t):
+                if t.lower().startswith(BAD_NAME_PREFIX_TUPLE) or RESET_NOISE_RE.search(t):
                     i = j  # Set main pointer to current position
                     break
                 j += 1
@@ -926,7 +1003,7 @@ def parse_register_tables(lines):
                     # next row is beginning; stop description
                     break
                 # Avoid adding reset blurbs or table labels
-                if t.lower().startswith(tuple(BAD_NAME_PREFIXES)) or RESET_NOISE_RE.search(t):
+                if t.lower().startswith(BAD_NAME_PREFIX_TUPLE) or RESET_NOISE_RE.search(t):
                     break
                 # ENHANCED: Filter out boilerplate sentences from descriptions
                 if boilerplate_sentence_re.match(t):
@@ -954,7 +1031,7 @@ def parse_register_tables(lines):
                 if (boilerplate_sentence_re.match(final_name) or 
                     document_boilerplate_re.search(final_name) or 
                     len(final_name) > 120 or 
-                    re.search(r'\. [A-Z]', final_name) or
+                    multi_sentence_re.search(final_name) or
                     final_name_stripped in EXPLICIT_BOILERPLATE_STRINGS or
                     final_name_stripped.startswith("This register is owned in the Non-secure space")):
                     # Reset buffer and continue without creating a row
@@ -1004,10 +1081,9 @@ def find_type_token_position(text):
     best_match = (None, None, None)
     
     # Search for each type token (longest first to handle R/W1C before RW)
-    for token in SORTED_TYPE_TOKENS:
+    for token, pattern in TYPE_TOKEN_WORD_PATTERNS:
         # Use word boundaries to avoid partial matches
-        pattern = r'\b' + re.escape(token) + r'\b'
-        matches = list(re.finditer(pattern, text))
+        matches = list(pattern.finditer(text))
         if matches:
             # Get the rightmost match
             last_match = matches[-1]
@@ -1047,7 +1123,7 @@ def parse_attribute_tables(lines):
             continue
 
         # Skip column headers including those with ligatures
-        if s.startswith("__PAGE_BREAK_") or s.lower() in HEADER_LABELS or re.match(r'^Bits\s+Name\s+', s):
+        if s.startswith("__PAGE_BREAK_") or s.lower() in HEADER_LABELS or attribute_header_re.match(s):
             i += 1
             continue
         
@@ -1056,10 +1132,11 @@ def parse_attribute_tables(lines):
         # Or: "[15:0]    field_name    Description text    RW    0x00"
         # Enhanced to handle field names with spaces in template expressions like htg#{index*8 + 7}_num_hn
         # First try to match field names with template expressions that may contain spaces
-        bits_match = re.match(r'^(\[\d+(?::\d+)?\])\s+([a-zA-Z_][a-zA-Z0-9_]*(?:#{[^}]+}[a-zA-Z0-9_]*)?)\s+(.*?)$', s)
-        if not bits_match:
-            # Fallback to original pattern for simpler field names
-            bits_match = re.match(r'^(\[\d+(?::\d+)?\])\s+(\S+)(?:\s+(.*?))?$', s)
+        # Both patterns start with '[bits]' - skip the regexes for every other line
+        bits_match = None
+        if s.startswith('['):
+            # Template field names first, falling back to the original pattern for simpler names
+            bits_match = attr_template_row_re.match(s) or attr_simple_row_re.match(s)
         if bits_match:
             bits = bits_match.group(1)
             field_name = bits_match.group(2)
@@ -1237,7 +1314,7 @@ def parse_attribute_tables(lines):
                     # very unlikely in attributes; but stop to be safe
                     break
                 # avoid stray "Reset value" etc.
-                if t.lower().startswith(tuple(BAD_NAME_PREFIXES)) or RESET_NOISE_RE.search(t):
+                if t.lower().startswith(BAD_NAME_PREFIX_TUPLE) or RESET_NOISE_RE.search(t):
                     break
                     
                 # CRITICAL FIX: If we have no name yet and this is the first desc part,
@@ -1270,7 +1347,7 @@ def parse_attribute_tables(lines):
                 if i < N and not (is_bits_token(lines[i]) or is_heading(lines[i]) or is_section_heading(lines[i])):
                     reset_candidate = lines[i].strip()
                     # don't keep obvious noise
-                    if not (reset_candidate.lower().startswith(tuple(BAD_NAME_PREFIXES)) or RESET_NOISE_RE.search(reset_candidate)):
+                    if not (reset_candidate.lower().startswith(BAD_NAME_PREFIX_TUPLE) or RESET_NOISE_RE.search(reset_candidate)):
                         reset = reset_candidate
                     i += 1
 
@@ -1347,9 +1424,8 @@ def extract_embedded_type_and_reset(description: str) -> tuple:
         return "", "", description
     
     # Pattern to match TYPE_TOKEN followed by reset value at end of description
-    # Use pre-sorted TYPE_TOKENS for longest-first matching to avoid conflicts
-    pattern = r'\s+(' + '|'.join(SORTED_TYPE_TOKENS) + r')\s+(0b[01]+|0x[0-9A-Fa-f]+|-)\s*$'
-    match = re.search(pattern, description)
+    # Uses pre-sorted TYPE_TOKENS for longest-first matching to avoid conflicts
+    match = EMBEDDED_TYPE_RESET_PATTERN.search(description)
     
     if match:
         extracted_type = match.group(1)
@@ -1569,7 +1645,7 @@ def is_valid_name_type_separation(potential_name: str, token: str, original_name
         return False
     
     # Name must contain at least one letter or underscore
-    if not re.search(r'[A-Za-z_]', potential_name):
+    if not has_letter_re.search(potential_name):
         return False
     
     # For very short potential names, be more conservative
@@ -1648,7 +1724,7 @@ def clean_rows(rows: list, is_attr: bool = False) -> list:
             if len(row[name_key]) > 120:
                 continue
             # ENHANCED: Skip entries that contain multiple sentences
-            if re.search(r'\. [A-Z]', row[name_key]):
+            if multi_sentence_re.search(row[name_key]):
                 continue
             
             # CRITICAL FIX: Skip malformed "Reserved" entries with concatenated text
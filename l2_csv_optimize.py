@@ -8,8 +8,11 @@ import pandas as pd
 import re
 import csv
 from pathlib import Path
+from functools import lru_cache
 import sys
 
+# Same table header repeats for every row of a block - parse each unique string once
+@lru_cache(maxsize=4096)
 def extract_reg_block_name(table_str):
     """
     Extract register block name from table header.
@@ -27,30 +30,41 @@ def extract_reg_block_name(table_str):
     
     return table_str  # Fallback
 
-def check_contiguous_segments(offset_pattern):
+def csv_value(value):
+    """Format a cell for csv.writer the way DataFrame.to_csv does (NaN -> empty)."""
+    if isinstance(value, float) and pd.isna(value):
+        return ''
+    return value
+
+# Multi-segment offset: {0-4} 0xF80 : 0xFA0 {5-31} 0x6028 : 0x60F8
+SEGMENT_PATTERN = re.compile(r'\{(\d+)-(\d+)\}\s*(0x[0-9A-Fa-f]+)\s*:\s*(0x[0-9A-Fa-f]+)')
+
+# Array registers repeat the same offset text across summary rows - parse each once
+@lru_cache(maxsize=4096)
+def parse_offset_segments(offset_pattern):
+    """
+    Parse the indexed segments of an offset pattern, converting numbers once.
+    Returns tuple of (start_idx, end_idx, start_addr, end_addr, start_hex, end_hex)
+    where the *_hex entries keep the original address text for output.
+    A tuple, so the cached result can't be modified by a caller.
+    """
+    return tuple((int(start_idx), int(end_idx), int(start_hex, 16), int(end_hex, 16), start_hex, end_hex)
+                 for start_idx, end_idx, start_hex, end_hex in SEGMENT_PATTERN.findall(offset_pattern))
+
+def check_contiguous_segments(segments):
     """
     Check if multi-segment offset pattern is actually contiguous.
-    Example: {0-4} 0xF80 : 0xFA0 {5-31} 0x6028 : 0x60F8
+    Takes the parsed segments from parse_offset_segments().
     
-    Returns: (is_contiguous, segments)
+    Returns: True if contiguous
     """
-    segments = re.findall(r'\{(\d+)-(\d+)\}\s*(0x[0-9A-Fa-f]+)\s*:\s*(0x[0-9A-Fa-f]+)', offset_pattern)
-    
-    if len(segments) <= 1:
-        return True, segments
-    
-    for i in range(len(segments) - 1):
-        curr_start_idx = int(segments[i][0])
-        curr_end_idx = int(segments[i][1])
-        curr_start_addr = int(segments[i][2], 16)
-        curr_end_addr = int(segments[i][3], 16)
-        
-        next_start_idx = int(segments[i+1][0])
-        next_start_addr = int(segments[i+1][2], 16)
+    for curr, nxt in zip(segments, segments[1:]):
+        curr_start_idx, curr_end_idx, curr_start_addr, curr_end_addr = curr[:4]
+        next_start_idx, _, next_start_addr, _ = nxt[:4]
         
         # Check if indices are contiguous
         if next_start_idx != curr_end_idx + 1:
-            return False, segments
+            return False
         
         # Calculate stride and check if addresses are contiguous
         count = curr_end_idx - curr_start_idx + 1
@@ -60,9 +74,9 @@ def check_contiguous_segments(offset_pattern):
             
             # Allow small tolerance for alignment
             if abs(next_start_addr - expected_next) > 0x8:
-                return False, segments
+                return False
     
-    return True, segments
+    return True
 
 def simplify_single_element_offset(offset, array_size):
     """
@@ -70,6 +84,10 @@ def simplify_single_element_offset(offset, array_size):
     0x23A8 : 0x23A8 -> 0x23a8
     {0-0} 0x23A8 : 0x23A8 -> 0x23a8
     """
+    # Already-simple offset (no range, no index prefix) - nothing to do
+    if ':' not in offset and '{' not in offset:
+        return offset
+    
     if array_size == 1:
         # Remove index prefix if present
         offset = re.sub(r'^\{[0-9]+-[0-9]+\}\s*', '', offset)
@@ -95,8 +113,8 @@ def determine_register_size(register_name, attributes_df):
     reg_fields = attributes_df[attributes_df['register_name'] == register_name]
     max_bit = 0
     
-    for _, row in reg_fields.iterrows():
-        bits = str(row['bits'])
+    for row in reg_fields.itertuples(index=False):
+        bits = str(row.bits)
         # Extract all numbers from the bits string
         numbers = re.findall(r'\d+', bits)
         if numbers:
@@ -117,13 +135,13 @@ def calculate_register_sizes_from_l1(input_csv):
     register_sizes = {}
     register_has_reserved_21 = {}  # Track if register has Reserved bit 21
     
-    for _, row in df.iterrows():
+    for row in df.itertuples(index=False):
         # Parse table header to get register name
-        table_id, register_name = parse_table_header(row['table'])
+        table_id, register_name = parse_table_header(row.table)
         
         # Get bit range and field name
-        bits = str(row['bits'])
-        field_name = str(row.get('field_name', '')).lower()  # Fixed: was 'name', should be 'field_name'
+        bits = str(row.bits)
+        field_name = str(getattr(row, 'field_name', '')).lower()  # Fixed: was 'name', should be 'field_name'
         
         # Check if this is Reserved bit 21 (single bit) 
         # Note: bits are in format like '[21]' not just '21'
@@ -161,36 +179,31 @@ def calculate_register_sizes_from_l1(input_csv):
     
     return register_sizes
 
-def parse_array_info(name, preserve_full_name=False):
+# Pattern: grp0-4_add_mask, reg0-31, region0-127, reg_0-31
+ARRAY_NAME_PATTERN = re.compile(r'(.+?)(\d+)-(\d+)(.*)$')
+
+@lru_cache(maxsize=4096)
+def parse_array_info(name):
     """
     Parse array information from register name.
-    Returns: (base_name, name_array_size, array_indices)
+    Returns: (stripped_name, full_name, name_array_size, array_indices)
     
-    Args:
-        name: The register name to parse
-        preserve_full_name: If True, keeps the full name with array indices
+    stripped_name has the indices removed (for matching/grouping), full_name
+    keeps them for display. Both come from a single regex match.
     """
-    # Pattern: grp0-4_add_mask, reg0-31, region0-127, reg_0-31
-    match = re.search(r'(.+?)(\d+)-(\d+)(.*)$', name)
+    match = ARRAY_NAME_PATTERN.search(name)
     if match:
         prefix = match.group(1).rstrip('_-')
         start_idx = int(match.group(2))
         end_idx = int(match.group(3))
         suffix = match.group(4)
         
-        if preserve_full_name:
-            # Keep the full name for display
-            base_name = name
-        else:
-            # Strip indices for matching/grouping
-            base_name = prefix + suffix
-        
         array_size = end_idx - start_idx + 1
         array_indices = f"{start_idx}-{end_idx}"
         
-        return base_name, array_size, array_indices
+        return prefix + suffix, name, array_size, array_indices
     
-    return name, 1, ""
+    return name, name, 1, ""
 
 def process_register_entry(row):
     """
@@ -201,16 +214,15 @@ def process_register_entry(row):
     offset = row['offset']
     results = []
     
-    # Parse array info from name twice - once for processing, once for display
-    stripped_name, name_array_size, name_indices = parse_array_info(name, preserve_full_name=False)
-    full_name, _, _ = parse_array_info(name, preserve_full_name=True)
+    # Parse array info from name once - stripped form for processing, full form for display
+    stripped_name, full_name, name_array_size, name_indices = parse_array_info(name)
     
     # Check for multi-segment offsets
-    segments = re.findall(r'\{(\d+)-(\d+)\}\s*(0x[0-9A-Fa-f]+)\s*:\s*(0x[0-9A-Fa-f]+)', offset)
+    segments = parse_offset_segments(offset)
     
     if len(segments) > 1:
         # Check if segments are contiguous
-        is_contiguous, _ = check_contiguous_segments(offset)
+        is_contiguous = check_contiguous_segments(segments)
         
         if not is_contiguous:
             # Split into separate entries for non-contiguous segments
@@ -228,14 +240,13 @@ def process_register_entry(row):
                     
                     # Find the matching segment
                     for seg_match in segments:
-                        seg_start = int(seg_match[0])
-                        seg_end = int(seg_match[1])
+                        seg_start, seg_end = seg_match[0], seg_match[1]
                         
                         # Check if this segment matches the group range
                         if seg_start == grp_start:
                             array_size = seg_end - seg_start + 1
                             new_entry = row.copy()
-                            new_entry['offset'] = f"{seg_match[2]} : {seg_match[3]}"
+                            new_entry['offset'] = f"{seg_match[4]} : {seg_match[5]}"
                             new_entry['array_size'] = array_size
                             new_entry['array_indices'] = f"{seg_start}-{seg_end}"
                             new_entry['name'] = name  # Use original full name
@@ -260,9 +271,7 @@ def process_register_entry(row):
             if not results:
                 # Default splitting for non-group arrays
                 for seg_match in segments:
-                    start_idx, end_idx, start_addr, end_addr = seg_match
-                    seg_start = int(start_idx)
-                    seg_end = int(end_idx)
+                    seg_start, seg_end, _, _, start_addr, end_addr = seg_match
                     array_size = seg_end - seg_start + 1
                     
                     # Create new entry for this segment
@@ -287,8 +296,7 @@ def process_register_entry(row):
     elif segments:
         # Single segment with index prefix
         seg = segments[0]
-        start_idx = int(seg[0])
-        end_idx = int(seg[1])
+        start_idx, end_idx = seg[0], seg[1]
         array_size = end_idx - start_idx + 1
         
         row['array_size'] = array_size
@@ -317,7 +325,10 @@ def optimize_register_summaries(input_csv, output_csv):
     
     # Process each row and collect results
     all_rows = []
-    for _, row in df.iterrows():
+    for row in df.itertuples(index=False):
+        # Plain dict per row - process_register_entry mutates and copies it
+        row = row._asdict()
+        
         # Extract register block name
         row['reg_block'] = extract_reg_block_name(row['table'])
         
@@ -357,52 +368,72 @@ def optimize_register_summaries(input_csv, output_csv):
 def optimize_register_summaries_with_size(input_csv, output_csv, register_sizes):
     """
     Transform register summaries CSV with array handling and register size detection.
+    Rows are streamed straight to the output CSV instead of being collected first.
+    Returns: number of rows written to output_csv
     """
     print(f"Processing {input_csv} with size detection...")
     df = pd.read_csv(input_csv)
     
-    # Process each row and collect results
-    all_rows = []
-    for _, row in df.iterrows():
-        # Extract register block name
-        row['reg_block'] = extract_reg_block_name(row['table'])
+    # Statistics accumulated while streaming (no final DataFrame scan)
+    n_rows = n_arrays = n_single = n_32 = n_64 = 0
+    unique_blocks = set()
+    
+    with open(output_csv, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        # Column order: reg_block, name, offset, array_size, array_indices, type, register_size, description
+        writer.writerow(['reg_block', 'name', 'offset', 'array_size', 'array_indices',
+                         'type', 'register_size', 'description'])
         
-        # Process array information
-        processed = process_register_entry(row)
-        for entry in processed:
-            # Reorder columns: reg_block, name, offset, array_size, array_indices, type, register_size, description
-            new_row = {
-                'reg_block': entry['reg_block'],
-                'name': entry['name'],
-                'offset': entry['offset'],
-                'array_size': entry.get('array_size', 1),
-                'array_indices': entry.get('array_indices', ''),
-                'type': entry['type'],
-                'register_size': register_sizes.get(entry['name'], 64),  # Use pre-calculated size, default to 64-bit
-                'description': entry['description']
-            }
+        for row in df.itertuples(index=False):
+            # Plain dict per row - process_register_entry mutates and copies it
+            row = row._asdict()
             
-            all_rows.append(new_row)
-    
-    # Create DataFrame with new structure
-    result_df = pd.DataFrame(all_rows)
+            # Extract register block name
+            row['reg_block'] = extract_reg_block_name(row['table'])
+            
+            # Process array information
+            processed = process_register_entry(row)
+            for entry in processed:
+                array_size = entry.get('array_size', 1)
+                register_size = register_sizes.get(entry['name'], 64)  # Use pre-calculated size, default to 64-bit
+                
+                writer.writerow([
+                    entry['reg_block'],
+                    csv_value(entry['name']),
+                    csv_value(entry['offset']),
+                    array_size,
+                    csv_value(entry.get('array_indices', '')),
+                    csv_value(entry['type']),
+                    register_size,
+                    csv_value(entry['description'])
+                ])
+                
+                n_rows += 1
+                if array_size > 1:
+                    n_arrays += 1
+                elif array_size == 1:
+                    n_single += 1
+                if register_size == 32:
+                    n_32 += 1
+                elif register_size == 64:
+                    n_64 += 1
+                unique_blocks.add(entry['reg_block'])
     
     # Preserve L1 document order - do not sort
     
-    # Save to CSV
-    result_df.to_csv(output_csv, index=False)
-    
     # Print statistics
     print(f"  Original rows: {len(df)}")
-    print(f"  Optimized rows: {len(result_df)}")
-    print(f"  Arrays detected: {len(result_df[result_df['array_size'] > 1])}")
-    print(f"  Single registers: {len(result_df[result_df['array_size'] == 1])}")
-    print(f"  32-bit registers: {len(result_df[result_df['register_size'] == 32])}")
-    print(f"  64-bit registers: {len(result_df[result_df['register_size'] == 64])}")
-    print(f"  Unique register blocks: {result_df['reg_block'].nunique()}")
-    
-    return result_df
+    print(f"  Optimized rows: {n_rows}")
+    print(f"  Arrays detected: {n_arrays}")
+    print(f"  Single registers: {n_single}")
+    print(f"  32-bit registers: {n_32}")
+    print(f"  64-bit registers: {n_64}")
+    print(f"  Unique register blocks: {len(unique_blocks)}")
+    
+    return n_rows
 
+# Cached: every field row of a register carries the same table header
+@lru_cache(maxsize=4096)
 def parse_table_header(table_str):
     """
     Parse table header to extract table ID and register name.
@@ -496,6 +527,8 @@ def separate_field_name_from_description(name_str):
     # No space found outside brackets - return whole string as field name
     return name_str, ''
 
+# Only a handful of distinct reset strings exist ('0b0', '0x0', '-', ...) - convert each once
+@lru_cache(maxsize=4096)
 def convert_reset_value(reset_str):
     """
     Convert reset values from binary (0bXXX) to hex (0xXXX) format.
@@ -577,33 +610,33 @@ def remove_duplicate_fields(df):
         best_row = None
         best_score = -1
         
-        for _, row in group.iterrows():
+        for idx, row in zip(group.index, group.itertuples(index=False)):
             score = 0
             
             # Valid type gets high score
-            if row['type'] in valid_types:
+            if row.type in valid_types:
                 score += 100
-            elif row['type'] == '-':
+            elif row.type == '-':
                 score += 10
             
             # Valid reset value
-            if pd.notna(row['reset']) and row['reset'] != '-':
+            if pd.notna(row.reset) and row.reset != '-':
                 score += 50
             
             # Longer, more complete description
-            if pd.notna(row['description']):
-                desc_len = len(str(row['description']))
+            if pd.notna(row.description):
+                desc_len = len(str(row.description))
                 score += min(desc_len, 200)  # Cap at 200 to avoid outliers
             
             # Valid field name
-            if pd.notna(row['field_name']) and row['field_name'] != '':
+            if pd.notna(row.field_name) and row.field_name != '':
                 score += 20
             
             if score > best_score:
                 best_score = score
-                best_row = row
+                best_row = idx
         
-        return best_row if best_row is not None else group.iloc[0]
+        return group.loc[best_row] if best_row is not None else group.iloc[0]
     
     # Apply selection to each group
     result = grouped.apply(select_best_row, include_groups=False).reset_index(drop=True)
@@ -715,6 +748,7 @@ def preprocess_attributes(df):
 def optimize_register_attributes(input_csv, output_csv):
     """
     Transform register attributes CSV with proper structure.
+    Returns: number of rows written to output_csv
     """
     print(f"\nProcessing {input_csv}...")
     df = pd.read_csv(input_csv)
@@ -725,60 +759,60 @@ def optimize_register_attributes(input_csv, output_csv):
     df = preprocess_attributes(df)
     print(f"  After pre-processing: {len(df)} rows (removed {original_count - len(df)} duplicates/invalid rows)")
     
-    # Process each row
-    all_rows = []
-    for _, row in df.iterrows():
-        # Get field name and clean it from embedded descriptions
-        raw_field_name = str(row['field_name']) if pd.notna(row['field_name']) else ''
-        field_name, extracted_desc = separate_field_name_from_description(raw_field_name)
-        
-        # Use existing description column if available, otherwise use extracted description
-        description = str(row.get('description', ''))
-        if not description and extracted_desc:
-            description = extracted_desc
-        
-        # Enable Reserved filtering - skip Reserved fields
-        if (field_name.lower() == 'reserved' or 
-            field_name.lower().startswith('reserved') or
-            'reserved for future' in description.lower()):
-            continue
-        
-        # Parse table header
-        table_id, register_name = parse_table_header(row['table'])
-        
-        # Process bit range
-        bits_reversed, bits_size = process_bit_range(row['bits'])
-        
-        # Convert reset value from binary to hex
-        reset_value = convert_reset_value(row['reset'])
-        
-        # Create new row
-        new_row = {
-            'table_id': table_id,
-            'register_name': register_name,
-            'field_name': field_name,
-            'bits': bits_reversed,
-            'bits_size': bits_size,
-            'type': row['type'],
-            'reset': reset_value
-        }
-        all_rows.append(new_row)
-    
-    # Create DataFrame with new structure
-    result_df = pd.DataFrame(all_rows)
-    
-    # Do NOT sort - preserve original order from input file
-    # This maintains the natural document order
+    # Stream each row straight to the output CSV
+    n_rows = 0
+    unique_registers = set()
     
-    # Save to CSV
-    result_df.to_csv(output_csv, index=False)
+    with open(output_csv, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['table_id', 'register_name', 'field_name', 'bits', 'bits_size', 'type', 'reset'])
+        
+        for row in df.itertuples(index=False):
+            # Get field name and clean it from embedded descriptions
+            raw_field_name = str(row.field_name) if pd.notna(row.field_name) else ''
+            field_name, extracted_desc = separate_field_name_from_description(raw_field_name)
+            
+            # Use existing description column if available, otherwise use extracted description
+            description = str(getattr(row, 'description', ''))
+            if not description and extracted_desc:
+                description = extracted_desc
+            
+            # Enable Reserved filtering - skip Reserved fields
+            if (field_name.lower() == 'reserved' or 
+                field_name.lower().startswith('reserved') or
+                'reserved for future' in description.lower()):
+                continue
+            
+            # Parse table header
+            table_id, register_name = parse_table_header(row.table)
+            
+            # Process bit range
+            bits_reversed, bits_size = process_bit_range(row.bits)
+            
+            # Convert reset value from binary to hex
+            reset_value = convert_reset_value(row.reset)
+            
+            # Do NOT sort - preserve original order from input file
+            # This maintains the natural document order
+            writer.writerow([
+                table_id,
+                register_name,
+                field_name,
+                bits_reversed,
+                bits_size,
+                csv_value(row.type),
+                csv_value(reset_value)
+            ])
+            
+            n_rows += 1
+            unique_registers.add(register_name)
     
     # Print statistics
     print(f"  Original rows: {len(df)}")
-    print(f"  Optimized rows: {len(result_df)}")
-    print(f"  Unique registers: {result_df['register_name'].nunique()}")
+    print(f"  Optimized rows: {n_rows}")
+    print(f"  Unique registers: {len(unique_registers)}")
     
-    return result_df
+    return n_rows
 
 def main():
     """Main function to run L2 optimization."""
@@ -804,9 +838,8 @@ def main():
     # Process register attributes (this filters out Reserved fields)
     attributes_output = output_dir / "register_attributes_optimized.csv"
     
-    attributes_df = None
     if attributes_input.exists():
-        attributes_df = optimize_register_attributes(attributes_input, attributes_output)
+        optimize_register_attributes(attributes_input, attributes_output)
     else:
         print(f"Warning: {attributes_input} not found")
     
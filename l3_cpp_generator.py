@@ -6,103 +6,137 @@ Reads L2 optimized CSVs and generates comprehensive JSON for C++ code generation
 
 import json
 import pandas as pd
-import re
+from bisect import bisect_left, insort
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
-def sanitize_name(name):
-    """Sanitize names for C++ identifiers (same as L4)"""
-    # Replace invalid C++ identifier characters
-    name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-    # Ensure it doesn't start with a number
-    if name and name[0].isdigit():
-        name = '_' + name
-    # Remove consecutive underscores
-    name = re.sub(r'_+', '_', name)
-    # Remove trailing underscores
-    name = name.strip('_')
-    return name
+from naming import sanitize_name, sanitize_names
 
-def deduplicate_attributes(attributes_df, output_dir):
+def save_deduplicated(dedup_df, dedup_path):
     """
-    Deduplicate fields in attributes dataframe.
-    - Remove exact duplicates (same register, field, bits)
-    - Rename fields with same name but different bits
+    Save the deduplicated attributes as CSV plus a Parquet copy next to it,
+    which L4's field generator reads back without re-parsing strings.
+    The Parquet copy needs pyarrow or fastparquet; without one, or if the write
+    fails, only the CSV is written and L4 falls back to it.
     """
-    print("\nPerforming field deduplication...")
+    dedup_df.to_csv(dedup_path, index=False)
     
-    deduplicated_rows = []
-    stats = {'duplicates_removed': 0, 'fields_renamed': 0}
+    parquet_path = dedup_path.with_suffix('.parquet')
+    try:
+        dedup_df.to_parquet(parquet_path, index=False, compression='zstd')
+    except ImportError:
+        # Don't leave a stale copy from an earlier run for L4 to pick up
+        parquet_path.unlink(missing_ok=True)
+    except (ValueError, TypeError, OSError) as e:
+        # Engine installed but the write failed (ArrowInvalid, mixed-type columns, disk errors)
+        # - drop any partly written file so L4 reads the CSV
+        print(f"  Warning: Could not write {parquet_path}, L4 will read the CSV: {e}")
+        parquet_path.unlink(missing_ok=True)
+
+def rename_field_collisions(unique_df, sanitized_names):
+    """
+    Rename fields whose raw or sanitized name collides with an earlier field
+    of the same register, and drop fields with no name.
+    Returns: (dedup_df, rename_log)
+    """
+    kept_labels = []  # Index labels of fields that survive, in output order
+    kept_names = []  # Their (possibly renamed) field names
     rename_log = []  # Track all renames for logging
     
-    for register_name in attributes_df['register_name'].unique():
-        register_fields = attributes_df[attributes_df['register_name'] == register_name]
-        
-        seen_exact = set()  # (field_name, bits) tuples
-        field_name_counts = {}  # Track field names for renaming
-        sanitized_name_counts = {}  # Track sanitized names to detect collisions
+    for register_name, register_fields in unique_df.groupby('register_name', sort=False, observed=True):
+        seen_field_names = set()  # Raw field names already used in this register
+        sanitized_owners = {}  # Sanitized name -> raw name that claimed it
+        sorted_sanitized = []  # Same keys kept sorted, for prefix counting
         
-        for _, row in register_fields.iterrows():
-            key = (row['field_name'], row['bits'])
-            
-            # Skip exact duplicates
-            if key in seen_exact:
-                stats['duplicates_removed'] += 1
-                continue
-            
-            seen_exact.add(key)
-            new_row = row.copy()
-            
-            field_name = row['field_name']
+        register_sanitized = sanitized_names.loc[register_fields.index]
+        for label, raw_name, bits, sanitized in zip(register_fields.index, register_fields['field_name'],
+                                                    register_fields['bits'], register_sanitized):
+            field_name = raw_name
             # Handle NaN or empty field names
             if pd.isna(field_name) or not str(field_name).strip():
                 continue
             
             field_name = str(field_name).strip()
-            sanitized = sanitize_name(field_name.upper())
-            
-            # Check for both raw name collisions and sanitized name collisions
-            needs_rename = False
+            output_name = raw_name  # Unchanged unless renamed below
             
             # Case 1: Same raw field name with different bits
-            if field_name in field_name_counts:
-                needs_rename = True
+            raw_collision = field_name in seen_field_names
             # Case 2: Different raw names but same sanitized name
-            elif sanitized in sanitized_name_counts and sanitized_name_counts[sanitized] != field_name:
-                needs_rename = True
-                
-            if needs_rename:
+            owner = sanitized_owners.get(sanitized)
+            
+            if raw_collision or (owner is not None and owner != field_name):
                 # Determine suffix based on sanitized name count
-                if sanitized in sanitized_name_counts:
-                    suffix = len([k for k in sanitized_name_counts.keys() if k.startswith(sanitized)]) + 1
+                if owner is not None:
+                    # Number of tracked names starting with this one (sanitized names are
+                    # plain ASCII, so they all sort between sanitized and sanitized + DEL)
+                    suffix = (bisect_left(sorted_sanitized, sanitized + '\x7f')
+                              - bisect_left(sorted_sanitized, sanitized)) + 1
                 else:
                     suffix = 1
                     
-                original_name = new_row['field_name']
-                new_row['field_name'] = f"{field_name}_{suffix}"
-                stats['fields_renamed'] += 1
+                renamed = f"{field_name}_{suffix}"
                 rename_log.append({
                     'register': register_name,
-                    'original': original_name,
-                    'renamed': new_row['field_name'],
-                    'bits': row['bits'],
-                    'reason': 'sanitized_collision' if field_name not in field_name_counts else 'raw_collision'
+                    'original': raw_name,
+                    'renamed': renamed,
+                    'bits': bits,
+                    'reason': 'raw_collision' if raw_collision else 'sanitized_collision'
                 })
                 
                 # Update tracking
-                field_name_counts[new_row['field_name']] = 1
-                sanitized_name_counts[sanitize_name(new_row['field_name'].upper())] = new_row['field_name']
-            else:
-                field_name_counts[field_name] = 1
-                sanitized_name_counts[sanitized] = field_name
+                output_name = field_name = renamed
+                sanitized = sanitize_name(renamed.upper())
             
-            deduplicated_rows.append(new_row)
+            seen_field_names.add(field_name)
+            if sanitized not in sanitized_owners:
+                insort(sorted_sanitized, sanitized)
+            sanitized_owners[sanitized] = field_name
+            
+            kept_labels.append(label)
+            kept_names.append(output_name)
+    
+    # Create deduplicated dataframe straight from the kept rows - no per-row dicts
+    dedup_df = unique_df.loc[kept_labels].reset_index(drop=True)
+    dedup_df['field_name'] = kept_names
+    
+    return dedup_df, rename_log
+
+def deduplicate_attributes(attributes_df, output_dir):
+    """
+    Deduplicate fields in attributes dataframe.
+    - Remove exact duplicates (same register, field, bits)
+    - Rename fields with same name but different bits
+    """
+    print("\nPerforming field deduplication...")
     
-    # Create deduplicated dataframe
-    dedup_df = pd.DataFrame(deduplicated_rows)
+    stats = {'duplicates_removed': 0, 'fields_renamed': 0}
+    
+    # Remove exact duplicates (same register, field, bits) in one pass
+    unique_df = attributes_df.drop_duplicates(['register_name', 'field_name', 'bits'], keep='first')
+    stats['duplicates_removed'] = len(attributes_df) - len(unique_df)
+    
+    # Sanitize every field name up front instead of per row
+    sanitized_names = sanitize_names(unique_df['field_name'].fillna('').astype(str).str.strip().str.upper())
+    
+    # Fast path: every field has a name and no two fields of a register sanitize
+    # to the same name, so nothing needs renaming - just group rows by register
+    blank_names = unique_df['field_name'].isna() | (unique_df['field_name'].astype(str).str.strip() == '')
+    name_collisions = pd.DataFrame({'register_name': unique_df['register_name'],
+                                    'sanitized': sanitized_names}).duplicated()
+    if not blank_names.any() and not name_collisions.any():
+        register_codes = pd.factorize(unique_df['register_name'])[0]
+        keep = register_codes >= 0
+        order = register_codes[keep].argsort(kind='stable')
+        dedup_df = unique_df[keep].iloc[order].reset_index(drop=True)
+        rename_log = []
+    else:
+        dedup_df, rename_log = rename_field_collisions(unique_df, sanitized_names)
+    stats['fields_renamed'] = len(rename_log)
     
     # Save deduplicated CSV
     dedup_path = output_dir / "register_attributes_deduplicated.csv"
-    dedup_df.to_csv(dedup_path, index=False)
+    save_deduplicated(dedup_df, dedup_path)
     
     # Save rename log if there were any renames
     if rename_log:
@@ -126,41 +160,24 @@ def deduplicate_registers(summaries_df, output_dir):
     """
     print("\nPerforming register deduplication...")
     
-    deduplicated_rows = []
-    stats = {'registers_renamed': 0}
-    rename_log = []
+    # Keep registers grouped by reg_block in first-appearance order
+    block_codes = pd.factorize(summaries_df['reg_block'])[0]
+    keep = block_codes >= 0
+    order = block_codes[keep].argsort(kind='stable')
+    dedup_df = summaries_df[keep].iloc[order].reset_index(drop=True)
     
-    for block in summaries_df['reg_block'].unique():
-        block_registers = summaries_df[summaries_df['reg_block'] == block]
-        
-        name_counts = {}  # Track register names for renaming
-        
-        for _, row in block_registers.iterrows():
-            new_row = row.to_dict()  # Convert to dict for new column
-            register_name = row['name']
-            
-            # Store original name for field matching
-            new_row['original_name'] = register_name
-            
-            # Rename if duplicate name in same block
-            if register_name in name_counts:
-                suffix = name_counts[register_name]
-                new_row['name'] = f"{register_name}_{suffix}"
-                name_counts[register_name] += 1
-                stats['registers_renamed'] += 1
-                rename_log.append({
-                    'block': block,
-                    'original': register_name,
-                    'renamed': new_row['name'],
-                    'offset': row['offset']
-                })
-            else:
-                name_counts[register_name] = 1
-            
-            deduplicated_rows.append(new_row)
+    # Store original name for field matching
+    dedup_df['original_name'] = dedup_df['name']
+    
+    # Rename if duplicate name in same block: 2nd occurrence gets _1, 3rd _2, ...
+    dup_idx = dedup_df.groupby(['reg_block', 'name'], sort=False, dropna=False, observed=True).cumcount()
+    renamed = dup_idx > 0
+    dedup_df.loc[renamed, 'name'] = dedup_df.loc[renamed, 'name'] + '_' + dup_idx[renamed].astype(str)
+    stats = {'registers_renamed': int(renamed.sum())}
     
-    # Create deduplicated dataframe
-    dedup_df = pd.DataFrame(deduplicated_rows)
+    rename_log = (dedup_df.loc[renamed, ['reg_block', 'original_name', 'name', 'offset']]
+                  .rename(columns={'reg_block': 'block', 'original_name': 'original', 'name': 'renamed'})
+                  .to_dict('records'))
     
     # Save deduplicated CSV
     dedup_path = output_dir / "register_summaries_deduplicated.csv"
@@ -180,6 +197,8 @@ def deduplicate_registers(summaries_df, output_dir):
     
     return dedup_df
 
+# Offsets and bit ranges repeat across rows - results are immutable, so cache them
+@lru_cache(maxsize=4096)
 def parse_offset(offset_str):
     """
     Parse offset string, taking start offset for ranges.
@@ -235,6 +254,7 @@ def parse_offset(offset_str):
     
     return int(offset_str) if offset_str.isdigit() else 0
 
+@lru_cache(maxsize=4096)
 def parse_bits(bits_str):
     """
     Parse bit range string to get low and high bit positions.
@@ -261,6 +281,7 @@ def parse_bits(bits_str):
         bit = int(bits_str)
         return bit, bit
 
+@lru_cache(maxsize=4096)
 def parse_reset_value(reset_str, bit_width=None):
     """
     Parse reset value from various formats.
@@ -275,15 +296,17 @@ def parse_reset_value(reset_str, bit_width=None):
     if reset_str == '-' or reset_str == '':
         return 0, False, "undefined"
     
+    prefix = reset_str[:2]
+    
     # Handle hex format
-    if reset_str.startswith('0x') or reset_str.startswith('0X'):
+    if prefix == '0x' or prefix == '0X':
         try:
             return int(reset_str, 16), True, reset_str
         except ValueError:
             return 0, False, reset_str
     
     # Handle binary format (should be converted to hex already, but just in case)
-    if reset_str.startswith('0b'):
+    if prefix == '0b':
         try:
             return int(reset_str[2:], 2), True, reset_str
         except ValueError:
@@ -297,12 +320,8 @@ def parse_reset_value(reset_str, bit_width=None):
         except ValueError:
             return 0, False, reset_str
     
-    # Non-numeric values
-    if any(keyword in reset_str.lower() for keyword in 
-           ['configuration', 'implementation', 'dependent', 'variable']):
-        return 0, False, reset_str
-    
-    # Unknown format
+    # Non-numeric values ("Configuration dependent", "Implementation defined", ...)
+    # and unknown formats
     return 0, False, reset_str
 
 def calculate_register_reset(fields):
@@ -314,15 +333,18 @@ def calculate_register_reset(fields):
     reset_flags = []
     
     for field in fields:
-        # Parse field reset
-        field_reset, is_fixed, original = parse_reset_value(field['reset'])
+        # Reuse the reset parsed while matching fields, if available
+        if 'reset_parsed' in field:
+            field_reset, is_fixed, reason = field['reset_parsed'], field['reset_is_fixed'], field['reset_reason']
+        else:
+            field_reset, is_fixed, reason = parse_reset_value(field['reset'])
         
         # Add flag if not fixed
         if not is_fixed:
             reset_flags.append({
                 'field': field['name'],
                 'bits': field['bits'],
-                'reason': original
+                'reason': reason
             })
         
         # Get bit positions
@@ -353,6 +375,15 @@ def calculate_register_reset(fields):
     
     return reset_value, reset_flags
 
+def parse_column(values, parser):
+    """
+    Apply one of the parse_* functions to a whole column.
+    The parser runs once per distinct value; results are returned in row order.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    parsed = [parser(value) for value in uniques]
+    return [parsed[code] for code in codes]
+
 
 def process_register_blocks():
     """
@@ -367,10 +398,12 @@ def process_register_blocks():
         return None
     
     print(f"Loading {summaries_path}...")
-    summaries_df = pd.read_csv(summaries_path)
+    # Grouping keys as category: groupby/isin work on small int codes instead of hashing strings
+    summaries_df = pd.read_csv(summaries_path, dtype={'reg_block': 'category'})
     
     print(f"Loading {attributes_path}...")
-    attributes_df = pd.read_csv(attributes_path)
+    attributes_df = pd.read_csv(attributes_path, dtype={'register_name': 'category'})
+    attributes_df['bits_size'] = pd.to_numeric(attributes_df['bits_size'], downcast='integer')
     
     # Deduplicate data and save to L3 directory
     output_dir = Path("L3_cpp_generator")
@@ -383,8 +416,10 @@ def process_register_blocks():
     
     # Process summaries to create register structure
     print("\nProcessing register summaries...")
-    for _, row in summaries_df.iterrows():
-        block_name = row['reg_block']
+    # Parse offsets for the whole column up front
+    offsets = parse_column(summaries_df['offset'], parse_offset)
+    for row, offset in zip(summaries_df.itertuples(index=False), offsets):
+        block_name = row.reg_block
         
         # Initialize block if needed
         if block_name not in register_blocks:
@@ -394,19 +429,18 @@ def process_register_blocks():
                 'registers': []
             }
         
-        # Parse offset
-        offset = parse_offset(row['offset'])
+        register_size = getattr(row, 'register_size', None)
         
         # Create register entry
         register = {
-            'name': row['name'],
-            'original_name': row.get('original_name', row['name']),  # For field matching
+            'name': row.name,
+            'original_name': getattr(row, 'original_name', row.name),  # For field matching
             'offset': offset,
-            'offset_hex': row['offset'],
-            'array_size': int(row['array_size']) if pd.notna(row['array_size']) else 1,
-            'array_indices': str(row['array_indices']) if pd.notna(row['array_indices']) else "",
-            'register_type': row['type'] if pd.notna(row['type']) else "RW",
-            'bit_width': int(row['register_size']) if 'register_size' in row and pd.notna(row['register_size']) else 64,
+            'offset_hex': row.offset,
+            'array_size': int(row.array_size) if pd.notna(row.array_size) else 1,
+            'array_indices': str(row.array_indices) if pd.notna(row.array_indices) else "",
+            'register_type': row.type if pd.notna(row.type) else "RW",
+            'bit_width': int(register_size) if pd.notna(register_size) else 64,
             'fields': [],
             'calculated_reset': 0,
             'reset_flags': []
@@ -414,61 +448,68 @@ def process_register_blocks():
         
         register_blocks[block_name]['registers'].append(register)
     
+    # Index registers by original_name (for renamed registers) so each field
+    # is matched with one dict lookup instead of scanning every register
+    registers_by_name = defaultdict(list)
+    for block in register_blocks.values():
+        for register in block['registers']:
+            registers_by_name[register.get('original_name', register['name'])].append(register)
+    
     # Add fields from attributes
     print("\nMatching fields to registers...")
     fields_matched = 0
     fields_unmatched = 0
     unmatched_fields = []  # Store unmatched fields for logging
     
-    for _, field_row in attributes_df.iterrows():
-        register_name = field_row['register_name']
+    has_register = attributes_df['register_name'].isin(list(registers_by_name))
+    matched_df = attributes_df[has_register]
+    
+    # Parse bit positions and reset values for the whole column up front
+    bit_ranges = parse_column(matched_df['bits'], parse_bits)
+    resets = parse_column(matched_df['reset'], parse_reset_value)
+    
+    # Missing values handled per column rather than with pd.notna() per row
+    bits_size_missing = matched_df['bits_size'].isna().to_numpy()
+    field_types = matched_df['type'].fillna("RW")
+    field_resets = matched_df['reset'].fillna("-")
+    
+    for field_row, (bit_low, bit_high), (reset_parsed, is_fixed, reset_reason), size_missing, field_type, field_reset in zip(
+            matched_df.itertuples(index=False), bit_ranges, resets, bits_size_missing, field_types, field_resets):
+        # Add field
+        field = {
+            'name': field_row.field_name,
+            'bits': field_row.bits,
+            'bit_low': bit_low,
+            'bit_high': bit_high,
+            'bits_size': (bit_high - bit_low + 1) if size_missing else int(field_row.bits_size),
+            'type': field_type,
+            'reset': field_reset,
+            'reset_parsed': reset_parsed,
+            'reset_is_fixed': is_fixed,
+            'reset_reason': reset_reason
+        }
         
-        # Find ALL registers with matching original_name (for duplicates)
-        found = False
-        for block in register_blocks.values():
-            for register in block['registers']:
-                # Match using original_name (for renamed registers) or name (for non-renamed)
-                match_name = register.get('original_name', register['name'])
-                if match_name == register_name:
-                    # Parse bit positions
-                    bit_low, bit_high = parse_bits(field_row['bits'])
-                    
-                    # Parse reset value
-                    reset_parsed, is_fixed, original = parse_reset_value(field_row['reset'])
-                    
-                    # Add field
-                    field = {
-                        'name': field_row['field_name'],
-                        'bits': field_row['bits'],
-                        'bit_low': bit_low,
-                        'bit_high': bit_high,
-                        'bits_size': int(field_row['bits_size']) if pd.notna(field_row['bits_size']) else (bit_high - bit_low + 1),
-                        'type': field_row['type'] if pd.notna(field_row['type']) else "RW",
-                        'reset': field_row['reset'] if pd.notna(field_row['reset']) else "-",
-                        'reset_parsed': reset_parsed,
-                        'reset_is_fixed': is_fixed
-                    }
-                    
-                    register['fields'].append(field)
-                    fields_matched += 1
-                    found = True
-                    # Don't break - add field to ALL matching registers
+        # Add field to ALL registers with matching original_name (for duplicates)
+        for register in registers_by_name[field_row.register_name]:
+            register['fields'].append(dict(field))
+            fields_matched += 1
+    
+    for field_row in attributes_df[~has_register].itertuples(index=False):
+        register_name = field_row.register_name
+        fields_unmatched += 1
+        print(f"  Warning: Could not match field to register: {register_name}.{field_row.field_name}")
         
-        if not found:
-            fields_unmatched += 1
-            print(f"  Warning: Could not match field to register: {register_name}.{field_row['field_name']}")
-            
-            # Store unmatched field details for logging
-            unmatched_fields.append({
-                'table_id': field_row.get('table_id', ''),
-                'register_name': register_name,
-                'field_name': field_row['field_name'],
-                'bits': field_row['bits'],
-                'bits_size': field_row.get('bits_size', ''),
-                'type': field_row.get('type', ''),
-                'reset': field_row.get('reset', ''),
-                'reason': 'Register name not found in summaries'
-            })
+        # Store unmatched field details for logging
+        unmatched_fields.append({
+            'table_id': getattr(field_row, 'table_id', ''),
+            'register_name': register_name,
+            'field_name': field_row.field_name,
+            'bits': field_row.bits,
+            'bits_size': getattr(field_row, 'bits_size', ''),
+            'type': getattr(field_row, 'type', ''),
+            'reset': getattr(field_row, 'reset', ''),
+            'reason': 'Register name not found in summaries'
+        })
     
     print(f"  Matched {fields_matched} fields")
     if fields_unmatched > 0:
@@ -541,30 +582,31 @@ def main():
     
     print(f"JSON output saved to: {output_file}")
     
-    # Also create a pretty-printed summary
+    # Also create a pretty-printed summary (built in memory, written in one call)
     summary_file = output_dir / "register_summary.txt"
-    with open(summary_file, 'w') as f:
-        f.write("Register Block Summary\n")
-        f.write("=" * 60 + "\n\n")
+    lines = ["Register Block Summary\n", "=" * 60 + "\n\n"]
+    
+    for block_name, block in data['register_blocks'].items():
+        lines.append(f"Block: {block_name}\n")
+        lines.append(f"  Size: 0x{block['size']:x} ({block['size']} bytes)\n")
+        lines.append(f"  Registers: {len(block['registers'])}\n")
         
-        for block_name, block in data['register_blocks'].items():
-            f.write(f"Block: {block_name}\n")
-            f.write(f"  Size: 0x{block['size']:x} ({block['size']} bytes)\n")
-            f.write(f"  Registers: {len(block['registers'])}\n")
-            
-            # Show first few registers
-            for i, reg in enumerate(block['registers'][:5]):
-                f.write(f"    - {reg['name']} @ 0x{reg['offset']:x}")
-                if reg['array_size'] > 1:
-                    f.write(f" [array size={reg['array_size']}]")
-                f.write(f" (reset=0x{reg['calculated_reset']:016x})")
-                if reg['reset_flags']:
-                    f.write(" *has non-fixed fields")
-                f.write("\n")
-            
-            if len(block['registers']) > 5:
-                f.write(f"    ... and {len(block['registers']) - 5} more\n")
-            f.write("\n")
+        # Show first few registers
+        for reg in block['registers'][:5]:
+            line = f"    - {reg['name']} @ 0x{reg['offset']:x}"
+            if reg['array_size'] > 1:
+                line += f" [array size={reg['array_size']}]"
+            line += f" (reset=0x{reg['calculated_reset']:016x})"
+            if reg['reset_flags']:
+                line += " *has non-fixed fields"
+            lines.append(line + "\n")
+        
+        if len(block['registers']) > 5:
+            lines.append(f"    ... and {len(block['registers']) - 5} more\n")
+        lines.append("\n")
+    
+    with open(summary_file, 'w') as f:
+        f.write(''.join(lines))
     
     print(f"Summary saved to: {summary_file}")
     
@@ -573,34 +615,37 @@ def main():
         unmatched_log_file = output_dir / "unmatched_fields.log"
         print(f"\nWriting unmatched fields log to {unmatched_log_file}...")
         
+        lines = [
+            "Unmatched Fields Log\n",
+            "=" * 60 + "\n\n",
+            f"Generated: {pd.Timestamp.now()}\n",
+            f"Total unmatched fields: {len(data['unmatched_fields'])}\n\n",
+        ]
+        
+        # Group by register name for better analysis
+        by_register = defaultdict(list)
+        for field in data['unmatched_fields']:
+            by_register[field['register_name']].append(field)
+        
+        lines.append("Fields grouped by register name:\n")
+        lines.append("-" * 40 + "\n\n")
+        
+        for register_name, fields in sorted(by_register.items()):
+            lines.append(f"Register: {register_name}\n")
+            lines.append(f"  Unmatched fields: {len(fields)}\n")
+            for field in fields:
+                lines.append(f"    - {field['field_name']} [{field['bits']}] {field['type']} (reset: {field['reset']})\n")
+            lines.append("\n")
+        
+        # Detailed CSV format for easy analysis
+        lines.append("\nDetailed CSV format:\n")
+        lines.append("-" * 20 + "\n")
+        lines.append("table_id,register_name,field_name,bits,bits_size,type,reset,reason\n")
+        for field in data['unmatched_fields']:
+            lines.append(f"{field['table_id']},{field['register_name']},{field['field_name']},{field['bits']},{field['bits_size']},{field['type']},{field['reset']},{field['reason']}\n")
+        
         with open(unmatched_log_file, 'w') as f:
-            f.write("Unmatched Fields Log\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Generated: {pd.Timestamp.now()}\n")
-            f.write(f"Total unmatched fields: {len(data['unmatched_fields'])}\n\n")
-            
-            # Group by register name for better analysis
-            from collections import defaultdict
-            by_register = defaultdict(list)
-            for field in data['unmatched_fields']:
-                by_register[field['register_name']].append(field)
-            
-            f.write("Fields grouped by register name:\n")
-            f.write("-" * 40 + "\n\n")
-            
-            for register_name, fields in sorted(by_register.items()):
-                f.write(f"Register: {register_name}\n")
-                f.write(f"  Unmatched fields: {len(fields)}\n")
-                for field in fields:
-                    f.write(f"    - {field['field_name']} [{field['bits']}] {field['type']} (reset: {field['reset']})\n")
-                f.write("\n")
-            
-            # Detailed CSV format for easy analysis
-            f.write("\nDetailed CSV format:\n")
-            f.write("-" * 20 + "\n")
-            f.write("table_id,register_name,field_name,bits,bits_size,type,reset,reason\n")
-            for field in data['unmatched_fields']:
-                f.write(f"{field['table_id']},{field['register_name']},{field['field_name']},{field['bits']},{field['bits_size']},{field['type']},{field['reset']},{field['reason']}\n")
+            f.write(''.join(lines))
         
         print(f"Unmatched fields log saved to: {unmatched_log_file}")
     
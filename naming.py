@@ -0,0 +1,35 @@
+"""
+Shared C++ identifier naming helpers
+Used by L3 (field collision detection) and L4 (C++ variable names) so both
+stages always agree on how a register/field name is sanitized
+"""
+
+import re
+from functools import lru_cache
+
+invalid_char_re = re.compile(r'[^a-zA-Z0-9_]')  # anything not allowed in a C++ identifier
+# Same replacement as invalid_char_re for ASCII input, done in C by str.translate
+invalid_char_table = {i: '_' for i in range(128) if not (chr(i).isalnum() or chr(i) == '_')}
+multi_underscore_re = re.compile(r'_+')
+
+# The same register/field names are sanitized over and over - cache the results
+@lru_cache(maxsize=None)
+def sanitize_name(name):
+    """Sanitize names for C++ identifiers"""
+    # Replace invalid C++ identifier characters
+    name = name.translate(invalid_char_table) if name.isascii() else invalid_char_re.sub('_', name)
+    # Ensure it doesn't start with a number
+    if name and name[0].isdigit():
+        name = '_' + name
+    # Remove consecutive underscores
+    name = multi_underscore_re.sub('_', name)
+    # Remove trailing underscores
+    name = name.strip('_')
+    return name
+
+def sanitize_names(names):
+    """Column version of sanitize_name for a Series of strings"""
+    names = names.str.replace(invalid_char_re, '_', regex=True)
+    names = names.str.replace(r'^(\d)', r'_\1', regex=True)
+    names = names.str.replace(multi_underscore_re, '_', regex=True)
+    return names.str.strip('_')
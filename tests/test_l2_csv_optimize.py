@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+L2 CSV Optimization tests - run from the repository root with:
+    python -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from l2_csv_optimize import check_contiguous_segments, parse_array_info, parse_offset_segments
+
+class TestCachedParsers(unittest.TestCase):
+    def test_offset_segments(self):
+        segments = parse_offset_segments("{0-4} 0xF80 : 0xFA0; {5-31} 0x6028 : 0x60F8")
+        self.assertEqual(segments, (
+            (0, 4, 0xF80, 0xFA0, "0xF80", "0xFA0"),
+            (5, 31, 0x6028, 0x60F8, "0x6028", "0x60F8"),
+        ))
+        self.assertFalse(check_contiguous_segments(segments))
+
+    def test_cached_segments_are_immutable(self):
+        offset = "{0-15} 0xD80 : 0xDF8; {16-47} 0x2880 : 0x2978"
+        segments = parse_offset_segments(offset)
+        self.assertIs(parse_offset_segments(offset), segments)
+        self.assertIsInstance(segments, tuple)
+
+    def test_array_info(self):
+        self.assertEqual(parse_array_info("cmn_hns_cml_port_aggr_grp0-4_add_mask"),
+                         ("cmn_hns_cml_port_aggr_grp_add_mask", "cmn_hns_cml_port_aggr_grp0-4_add_mask", 5, "0-4"))
+        self.assertEqual(parse_array_info("por_apb_rcr"), ("por_apb_rcr", "por_apb_rcr", 1, ""))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+L3 C++ Generator tests - run from the repository root with:
+    python -m unittest discover tests
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import l3_cpp_generator
+from wide_register import WideRegisterTestCase
+
+class TestWideRegisterJson(WideRegisterTestCase):
+    """register_data.json must be written for resets that do not fit in 64 bits"""
+
+    def test_field_above_64_bits(self):
+        self.assertEqual(l3_cpp_generator.main(), 0)
+
+        with open("L3_cpp_generator/register_data.json") as f:
+            data = json.load(f)
+        register = data['register_blocks']['wide_regs']['registers'][0]
+        upper = register['fields'][0]
+
+        self.assertEqual(upper['bit_low'], 64)
+        self.assertEqual(upper['reset_parsed'], 2**64 - 1)
+        self.assertEqual(register['calculated_reset'], ((2**64 - 1) << 64) | 1)
+        self.assertEqual(register['calculated_reset_hex'], "0xffffffffffffffff0000000000000001")
+
+if __name__ == "__main__":
+    unittest.main()
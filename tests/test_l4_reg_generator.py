@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+L4 C++ Generator tests - run from the repository root with:
+    python -m unittest discover tests
+"""
+
+import importlib.util
+import sys
+import unittest
+import warnings
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import l3_cpp_generator
+import l4_reg_generator
+from wide_register import WideRegisterTestCase
+
+class L4TestCase(WideRegisterTestCase):
+    """Runs L3 on the wide register L2 CSVs so L4 has inputs"""
+
+    def setUp(self):
+        super().setUp()
+        with redirect_stdout(StringIO()):
+            self.assertEqual(l3_cpp_generator.main(), 0)
+
+    def run_l4(self):
+        with redirect_stdout(StringIO()):
+            self.assertEqual(l4_reg_generator.main(), 0)
+        field_cpp = Path("L4_Reg_generator/field.cpp").read_text()
+        register_cpp = Path("L4_Reg_generator/register.cpp").read_text()
+        return field_cpp, register_cpp
+
+class TestWideRegister(L4TestCase):
+    def test_reset_above_64_bits(self):
+        field_cpp, register_cpp = self.run_l4()
+        self.assertIn('vlab::Field128 WIDE_REG_UPPER {"upper", 64, 64};', field_cpp)
+        self.assertIn("0xffffffffffffffff0000000000000001", register_cpp)
+
+def has_parquet_engine():
+    return any(importlib.util.find_spec(name) is not None for name in ("pyarrow", "fastparquet"))
+
+@unittest.skipUnless(has_parquet_engine(), "pyarrow/fastparquet not installed - L3 writes no Parquet copy")
+class TestParquetHandoff(L4TestCase):
+    """L3 writes a Parquet copy of the deduplicated attributes only, and L4 reads it"""
+
+    def test_only_attributes_copy_written(self):
+        self.assertTrue(Path("L3_cpp_generator/register_attributes_deduplicated.parquet").exists())
+        self.assertFalse(Path("L3_cpp_generator/register_summaries_deduplicated.parquet").exists())
+
+    def test_reads_attributes_parquet(self):
+        # Make the Parquet copy differ from the CSV so the test shows which one L4 read
+        parquet_path = Path("L3_cpp_generator/register_attributes_deduplicated.parquet")
+        attributes_df = pd.read_parquet(parquet_path)
+        attributes_df.loc[attributes_df['field_name'] == 'lower', 'type'] = 'W1C'
+        attributes_df.to_parquet(parquet_path, index=False)
+        
+        field_cpp, _ = self.run_l4()
+        self.assertIn('vlab::Field128 WIDE_REG_LOWER {"lower", 0, 64, vlab::Access::read_write, '
+                      'vlab::WriteEffect::one_to_clear};', field_cpp)
+
+    def test_csv_fallback_matches_parquet(self):
+        from_parquet = self.run_l4()
+        Path("L3_cpp_generator/register_attributes_deduplicated.parquet").unlink()
+        from_csv = self.run_l4()
+        self.assertEqual(from_parquet, from_csv)
+        self.assertIn('vlab::Field128 WIDE_REG_LOWER {"lower", 0, 64, vlab::Access::read_only};', from_csv[0])
+
+    def test_failed_parquet_write_falls_back_to_csv(self):
+        parquet_path = Path("L3_cpp_generator/register_attributes_deduplicated.parquet")
+        expected = self.run_l4()
+        with mock.patch.object(pd.DataFrame, 'to_parquet', side_effect=ValueError("mixed types")):
+            with redirect_stdout(StringIO()):
+                self.assertEqual(l3_cpp_generator.main(), 0)
+        self.assertFalse(parquet_path.exists())
+        self.assertEqual(self.run_l4(), expected)
+
+    def test_reads_parquet_without_warnings(self):
+        # register_name comes back as category from Parquet - groupbys must not warn about observed=
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.run_l4()
+        self.assertEqual([str(w.message) for w in caught], [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Shared L3/L4 test fixture: a 128-bit register whose reset does not fit in 64 bits,
+written as L2 optimized CSVs into a temporary working directory
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+SUMMARIES_CSV = """reg_block,name,offset,array_size,array_indices,type,register_size,description
+wide_regs,wide_reg,0x0,1,,RW,128,Wide register
+"""
+
+ATTRIBUTES_CSV = """table_id,register_name,field_name,bits,bits_size,type,reset
+Table 1-1,wide_reg,upper,[127:64],64,RW,0xFFFFFFFFFFFFFFFF
+Table 1-1,wide_reg,lower,[63:0],64,RO,0x1
+"""
+
+class WideRegisterTestCase(unittest.TestCase):
+    """Runs each test in a temporary directory holding the L2 CSVs above"""
+
+    def setUp(self):
+        self.old_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        l2_dir = Path("L2_csv_optimize")
+        l2_dir.mkdir()
+        (l2_dir / "register_summaries_optimized.csv").write_text(SUMMARIES_CSV)
+        (l2_dir / "register_attributes_optimized.csv").write_text(ATTRIBUTES_CSV)
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        self.temp_dir.cleanup()